@@ -2,7 +2,7 @@
 Learn-with-Me: Enhanced Flashcard App
 
 Features:
-- Upload PDF, extract text (PyPDF2)
+- Upload PDF, extract text (PyMuPDF)
 - Generate logical fill-in-the-blank flashcards
 - Store in SQLite (flashcards.db)
 - View & search flashcards with multi-delete option
@@ -15,7 +15,7 @@ Save this file as `app.py` and run: `streamlit run app.py`
 """
 
 import streamlit as st
-import PyPDF2
+import fitz  # PyMuPDF
 import sqlite3
 import random
 import os
@@ -27,12 +27,39 @@ from datetime import date, datetime, timedelta
 # -------------------------------
 DB_PATH = "flashcards.db"
 
+# Shared INSERT text so sqlite3's per-connection statement cache reuses one
+# prepared statement
+INSERT_SQL = "INSERT INTO flashcards (question, answer, difficulty, next_review, is_read) VALUES (?, ?, ?, ?, ?)"
+
+# Text processing used by generate_logical_qa_pairs
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+_STOP = frozenset({'the', 'and', 'for', 'with', 'that', 'this', 'which', 'from', 'have', 'has', 'had'})
+
 # -------------------------------
 # Database helpers with Migration
 # -------------------------------
 
+def get_conn():
+    """SQLite connection for the current browser session, reused across its reruns"""
+    # One connection per session keeps each tab's transactions separate.
+    # Streamlit may run a session's reruns on different threads, hence
+    # check_same_thread=False.
+    if 'db_conn' not in st.session_state:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        # Tune SQLite for a single-user local app: WAL lets the stats reads run
+        # alongside writes, and NORMAL sync drops one fsync per commit.
+        # These are per-connection settings, so apply them once on open.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        st.session_state.db_conn = conn
+    return st.session_state.db_conn
+
+
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     c = conn.cursor()
     
     # Create main table
@@ -55,139 +82,172 @@ def init_db():
     if 'is_read' not in columns:
         c.execute("ALTER TABLE flashcards ADD COLUMN is_read BOOLEAN DEFAULT FALSE")
     
-    if 'display_order' not in columns:
-        c.execute("ALTER TABLE flashcards ADD COLUMN display_order INTEGER")
-        # Initialize display_order for existing records
-        c.execute("SELECT id FROM flashcards ORDER BY id")
-        existing_ids = [row[0] for row in c.fetchall()]
-        for order, card_id in enumerate(existing_ids, 1):
-            c.execute("UPDATE flashcards SET display_order = ? WHERE id = ?", (order, card_id))
+    # Speeds up the quiz's difficulty / due-date filtering
+    c.execute("CREATE INDEX IF NOT EXISTS idx_diff_review ON flashcards(difficulty, next_review)")
     
     conn.commit()
-    conn.close()
 
 
-def insert_flashcard(question, answer, difficulty=1, next_review=None):
+def mark_db_dirty():
+    """Drop the cached stats so every session recomputes them after a write"""
+    # st.cache_data is shared by the whole process, so clearing it here
+    # invalidates other tabs too, not just the one that wrote
+    get_stats.clear()
+
+
+@st.cache_data(ttl=2)
+def get_stats(today_iso):
+    """Return (total, unread, due, {difficulty: count}) for the sidebar and Performance page"""
+    c = get_conn().cursor()
+    c.execute(
+        """
+        SELECT COUNT(*),
+               COALESCE(SUM(CASE WHEN is_read = FALSE THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN next_review <= ? OR next_review IS NULL THEN 1 ELSE 0 END), 0)
+        FROM flashcards
+        """,
+        (today_iso,),
+    )
+    total, unread, due = c.fetchone()
+    
+    c.execute("SELECT difficulty, COUNT(*) FROM flashcards GROUP BY difficulty")
+    difficulty_stats = dict(c.fetchall())
+    return total, unread, due, difficulty_stats
+
+
+def insert_flashcards_bulk(pairs, difficulty=1, next_review=None, chunk_size=500):
+    """Insert many (question, answer) pairs in a single transaction"""
     if next_review is None:
         next_review = date.today().isoformat()
     
-    # Get the next display order number
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT COALESCE(MAX(display_order), 0) FROM flashcards")
-    next_order = c.fetchone()[0] + 1
+    rows = [(question, answer, difficulty, next_review, False) for question, answer in pairs]
     
-    c.execute(
-        "INSERT INTO flashcards (question, answer, difficulty, next_review, is_read, display_order) VALUES (?, ?, ?, ?, ?, ?)",
-        (question, answer, difficulty, next_review, False, next_order),
-    )
-    conn.commit()
-    conn.close()
+    conn = get_conn()
+    with conn:
+        # Feed rows in fixed-size chunks to keep each batch bounded
+        for i in range(0, len(rows), chunk_size):
+            conn.executemany(
+                INSERT_SQL,
+                rows[i:i + chunk_size],
+            )
+    mark_db_dirty()
+    return len(rows)
 
 
 def update_flashcard_review(card_id, new_difficulty, next_review_date):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute(
-        "UPDATE flashcards SET difficulty = ?, next_review = ? WHERE id = ?",
-        (new_difficulty, next_review_date.isoformat(), card_id),
-    )
-    conn.commit()
-    conn.close()
+    conn = get_conn()
+    with conn:
+        conn.execute(
+            "UPDATE flashcards SET difficulty = ?, next_review = ? WHERE id = ?",
+            (new_difficulty, next_review_date.isoformat(), card_id),
+        )
+    mark_db_dirty()
 
 
-def mark_as_read(card_id):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute(
-        "UPDATE flashcards SET is_read = TRUE WHERE id = ?",
-        (card_id,),
-    )
-    conn.commit()
-    conn.close()
+def mark_as_read(card_ids):
+    """Mark several flashcards read in a single transaction"""
+    if not card_ids:
+        return
+    conn = get_conn()
+    with conn:
+        # One bound id per statement, so no SQL-variable limit however many cards
+        conn.executemany(
+            "UPDATE flashcards SET is_read = TRUE WHERE id = ?",
+            [(card_id,) for card_id in card_ids],
+        )
+    mark_db_dirty()
 
 
 def delete_flashcard(card_id):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("DELETE FROM flashcards WHERE id = ?", (card_id,))
-    conn.commit()
-    conn.close()
-    # Reorder remaining flashcards
-    reorder_flashcards()
+    conn = get_conn()
+    with conn:
+        conn.execute("DELETE FROM flashcards WHERE id = ?", (card_id,))
+    mark_db_dirty()
 
 
 def delete_multiple_flashcards(card_ids):
     if not card_ids:
         return
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
+    conn = get_conn()
     placeholders = ','.join('?' for _ in card_ids)
-    c.execute(f"DELETE FROM flashcards WHERE id IN ({placeholders})", card_ids)
-    conn.commit()
-    conn.close()
-    # Reorder remaining flashcards
-    reorder_flashcards()
-
-
-def reorder_flashcards():
-    """Renumber display_order after deletions to maintain proper numbering"""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
-    # Get all flashcards ordered by their current display_order
-    c.execute("SELECT id FROM flashcards ORDER BY display_order")
-    flashcards = c.fetchall()
-    
-    # Update display_order sequentially
-    for new_order, (card_id,) in enumerate(flashcards, 1):
-        c.execute("UPDATE flashcards SET display_order = ? WHERE id = ?", (new_order, card_id))
-    
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(f"DELETE FROM flashcards WHERE id IN ({placeholders})", card_ids)
+    mark_db_dirty()
 
 # -------------------------------
 # PDF extraction & QA generation
 # -------------------------------
 
-def extract_text_from_pdf(uploaded_file):
+@st.cache_data(show_spinner=False, max_entries=8)
+def extract_text_from_pdf(file_bytes: bytes) -> str:
+    """Extract text from PDF bytes; cached so reruns skip re-parsing the file"""
     try:
-        pdf_reader = PyPDF2.PdfReader(uploaded_file)
+        doc = fitz.open(stream=file_bytes, filetype="pdf")
     except Exception as e:
         st.error(f"Failed to read PDF: {e}")
         return ""
 
-    text = ""
-    total_pages = len(pdf_reader.pages) if getattr(pdf_reader, 'pages', None) else 0
+    parts = []
+    total_pages = doc.page_count
     progress = st.progress(0)
 
-    for i, page in enumerate(pdf_reader.pages):
+    for i, page in enumerate(doc):
         try:
-            page_text = page.extract_text()
+            page_text = page.get_text("text")
         except Exception:
             page_text = None
         if page_text:
-            text += page_text + "\n"
+            parts.append(page_text)
         if total_pages:
             progress.progress((i + 1) / total_pages)
     progress.empty()
-    return text
+    doc.close()
+    return "\n".join(parts)
 
 
 def clean_text(text):
     return " ".join(text.split())
 
 
-def generate_logical_qa_pairs(text, num_questions=5):
+def _iter_blocks(text):
+    """Group blank-line separated paragraphs into blocks that end a sentence"""
+    # A paragraph that doesn't end in .!? (e.g. at a page break) continues
+    # into the next one, so it's carried over instead of ending the block
+    parts = []
+    for paragraph in text.split('\n\n'):
+        parts.append(paragraph)
+        if paragraph.rstrip().endswith(('.', '!', '?')):
+            yield '\n\n'.join(parts)
+            parts = []
+    if parts:
+        yield '\n\n'.join(parts)
+
+
+def _iter_sentences(text):
+    """Lazily yield stripped sentences longer than 50 characters"""
+    for block in _iter_blocks(text):
+        # A block of 50 characters or fewer can't hold a qualifying sentence,
+        # so skip it before running the regex over it
+        if len(block) <= 50:
+            continue
+        block = clean_text(block)
+        start = 0
+        for match in _SENT_RE.finditer(block):
+            sent = block[start:match.start()].strip()
+            start = match.end()
+            if len(sent) > 50:
+                yield sent
+        sent = block[start:].strip()
+        if len(sent) > 50:
+            yield sent
+
+
+@st.cache_data(show_spinner=False)
+def generate_logical_qa_pairs(text: str, num_questions: int = 5):
     """Generate more logical and meaningful flashcards"""
-    # Split into sentences
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    sentences = [s.strip() for s in sentences if len(s.strip()) > 50]
-    
     questions = []
     
-    for i in range(min(num_questions, len(sentences))):
-        sent = sentences[i]
+    for sent in _iter_sentences(text):
         words = sent.split()
         
         if len(words) < 8:
@@ -199,7 +259,7 @@ def generate_logical_qa_pairs(text, num_questions=5):
             clean_word = word.strip('.,!?;:"()[]{}')
             # Skip short words, articles, prepositions
             if (len(clean_word) > 4 and 
-                not clean_word.lower() in ['the', 'and', 'for', 'with', 'that', 'this', 'which', 'from', 'have', 'has', 'had'] and
+                clean_word.lower() not in _STOP and
                 j > 2 and j < len(words) - 2):
                 important_words.append((j, clean_word))
         
@@ -218,6 +278,10 @@ def generate_logical_qa_pairs(text, num_questions=5):
             "answer": blank_word,
             "sentence": sent
         })
+        
+        # Stop scanning as soon as we have enough cards
+        if len(questions) >= num_questions:
+            break
     
     return questions
 
@@ -228,11 +292,10 @@ def generate_logical_qa_pairs(text, num_questions=5):
 def run_quiz():
     """Run the quiz based on configuration"""
     config = st.session_state.quiz_config
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
+    c = get_conn().cursor()
     
     # Build query based on configuration
-    query = "SELECT id, question, answer, difficulty, next_review FROM flashcards"
+    query = "SELECT id FROM flashcards"
     conditions = []
     params = []
     
@@ -253,12 +316,22 @@ def run_quiz():
     if conditions:
         query += " WHERE " + " AND ".join(conditions)
     
-    query += " ORDER BY RANDOM() LIMIT ?"
-    params.append(config['num_questions'])
-    
+    # Sample matching ids in Python rather than sorting every row by RANDOM()
     c.execute(query, params)
-    quiz_cards = c.fetchall()
-    conn.close()
+    ids = [row[0] for row in c.fetchall()]
+    chosen = random.sample(ids, min(config['num_questions'], len(ids)))
+    if not chosen:
+        return []
+    
+    placeholders = ','.join('?' for _ in chosen)
+    c.execute(
+        f"SELECT id, question, answer, difficulty, next_review FROM flashcards WHERE id IN ({placeholders})",
+        chosen,
+    )
+    cards_by_id = {row[0]: row for row in c.fetchall()}
+    
+    # Keep the random order of the sample
+    quiz_cards = [cards_by_id[card_id] for card_id in chosen]
     
     return quiz_cards
 
@@ -295,38 +368,8 @@ def main():
         st.markdown("---")
         st.markdown("### 📊 Statistics")
         
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute("SELECT COUNT(*) FROM flashcards")
-        total_cards = c.fetchone()[0]
-        
-        # Safe query for is_read column
-        try:
-            c.execute("SELECT COUNT(*) FROM flashcards WHERE is_read = FALSE")
-            unread_cards = c.fetchone()[0]
-        except:
-            unread_cards = total_cards  # If column doesn't exist yet, assume all are unread
-        
-        today_iso = date.today().isoformat()
-        c.execute("SELECT COUNT(*) FROM flashcards WHERE next_review <= ? OR next_review IS NULL", (today_iso,))
-        due_cards = c.fetchone()[0]
-        
-        # Get difficulty distribution
-        c.execute("SELECT difficulty, COUNT(*) FROM flashcards GROUP BY difficulty")
-        difficulty_stats = dict(c.fetchall())
-        conn.close()
-        
-        st.metric("Total Flashcards", total_cards)
-        st.metric("Unread Cards", unread_cards)
-        st.metric("Due Today", due_cards)
-        
-        if total_cards > 0:
-            st.markdown("**Difficulty Distribution:**")
-            for diff in range(1, 6):
-                count = difficulty_stats.get(diff, 0)
-                if count > 0:
-                    percentage = (count / total_cards) * 100
-                    st.write(f"Level {diff}: {count} ({percentage:.1f}%)")
+        # Filled in after the page renders, so writes made by the page are counted
+        stats_container = st.container()
         
         st.markdown("---")
         st.markdown("✨ Smart Flashcards")
@@ -346,7 +389,7 @@ def main():
             num_q = st.number_input("Number of flashcards to generate", min_value=1, max_value=30, value=8)
 
         if uploaded_file is not None:
-            text = extract_text_from_pdf(uploaded_file)
+            text = extract_text_from_pdf(uploaded_file.getvalue())
             cleaned = clean_text(text)
 
             with st.expander("📄 View Extracted Text"):
@@ -354,21 +397,21 @@ def main():
 
             if st.button("Generate Logical Flashcards", key="gen_cards", type="primary"):
                 with st.spinner("Generating smart flashcards..."):
-                    qa_pairs = generate_logical_qa_pairs(cleaned, num_questions=int(num_q))
+                    # Pass the raw text so paragraph breaks survive for the prefilter
+                    qa_pairs = generate_logical_qa_pairs(text, num_questions=int(num_q))
                 
                 if not qa_pairs:
                     st.warning("Couldn't generate quality flashcards. Try a different file with more substantive content.")
                 else:
-                    valid_count = 0
-                    for pair in qa_pairs:
-                        if (pair["question"].strip() and pair["answer"].strip()):
-                            insert_flashcard(
-                                pair["question"], 
-                                pair["answer"], 
-                                difficulty=1, 
-                                next_review=date.today().isoformat()
-                            )
-                            valid_count += 1
+                    valid_count = insert_flashcards_bulk(
+                        [
+                            (pair["question"], pair["answer"])
+                            for pair in qa_pairs
+                            if pair["question"].strip() and pair["answer"].strip()
+                        ],
+                        difficulty=1,
+                        next_review=date.today().isoformat()
+                    )
                     
                     if valid_count > 0:
                         st.success(f"✅ Generated {valid_count} logical flashcards!")
@@ -390,35 +433,26 @@ def main():
         
         search_term = st.text_input("🔍 Search flashcards by keyword:")
 
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
+        c = get_conn().cursor()
         
-        # Safe query with fallback for display_order
-        try:
-            if search_term:
-                query = """SELECT id, question, answer, difficulty, next_review, is_read, display_order 
-                         FROM flashcards 
-                         WHERE question LIKE ? OR answer LIKE ? 
-                         ORDER BY display_order"""
-                params = (f"%{search_term}%", f"%{search_term}%")
-            else:
-                query = "SELECT id, question, answer, difficulty, next_review, is_read, display_order FROM flashcards ORDER BY display_order"
-                params = ()
-        except:
-            # Fallback if display_order doesn't exist yet
-            if search_term:
-                query = """SELECT id, question, answer, difficulty, next_review, 0 as is_read, id as display_order 
-                         FROM flashcards 
-                         WHERE question LIKE ? OR answer LIKE ? 
-                         ORDER BY id"""
-                params = (f"%{search_term}%", f"%{search_term}%")
-            else:
-                query = "SELECT id, question, answer, difficulty, next_review, 0 as is_read, id as display_order FROM flashcards ORDER BY id"
-                params = ()
+        # Card numbers are computed over the whole collection at read time, so
+        # deletions never have to renumber the stored rows
+        if search_term:
+            query = """SELECT id, question, answer, difficulty, next_review, is_read, display_order 
+                     FROM (SELECT id, question, answer, difficulty, next_review, is_read,
+                                  ROW_NUMBER() OVER (ORDER BY id) AS display_order
+                           FROM flashcards) 
+                     WHERE question LIKE ? OR answer LIKE ? 
+                     ORDER BY id"""
+            params = (f"%{search_term}%", f"%{search_term}%")
+        else:
+            query = """SELECT id, question, answer, difficulty, next_review, is_read,
+                            ROW_NUMBER() OVER (ORDER BY id) AS display_order
+                     FROM flashcards ORDER BY id"""
+            params = ()
         
         c.execute(query, params)
         rows = c.fetchall()
-        conn.close()
 
         if not rows:
             st.info("No flashcards found. Upload notes to create flashcards.")
@@ -434,6 +468,7 @@ def main():
                     st.session_state.selected_cards = set()
                     st.rerun()
             
+            newly_read = []
             for r in rows:
                 card_id, question, answer, difficulty, next_review, is_read, display_order = r
                 
@@ -450,36 +485,27 @@ def main():
                         st.session_state.selected_cards.remove(card_id)
                 
                 with col2:
-                    # Check if we can mark as read (column exists)
-                    can_mark_read = True
-                    try:
-                        conn = sqlite3.connect(DB_PATH)
-                        c = conn.cursor()
-                        c.execute("PRAGMA table_info(flashcards)")
-                        columns = [col[1] for col in c.fetchall()]
-                        can_mark_read = 'is_read' in columns
-                        conn.close()
-                    except:
-                        can_mark_read = False
+                    # The expander body runs on every render, so each card shown is
+                    # treated as read; settle that before building the label so the
+                    # checkmark and Status line agree
+                    if not is_read:
+                        # Collected and written in one transaction after the loop
+                        newly_read.append(card_id)
+                        is_read = True
                     
-                    # Mark as read when expanded
-                    with st.expander(f"#{display_order} - {'✅' if is_read and can_mark_read else '❌'}: {question[:40]}...", expanded=False):
-                        # Mark as read when user opens the flashcard (if possible)
-                        if can_mark_read and not is_read:
-                            mark_as_read(card_id)
-                            st.rerun()
-                        
+                    with st.expander(f"#{display_order} - {'✅' if is_read else '❌'}: {question[:40]}...", expanded=False):
                         st.write(f"**Q:** {question}")
                         st.write(f"**A:** {answer}")
                         st.write(f"**Difficulty:** {difficulty}")
-                        if can_mark_read:
-                            st.write(f"**Status:** {'Read' if is_read else 'Unread'}")
+                        st.write(f"**Status:** {'Read' if is_read else 'Unread'}")
                         st.write(f"**Next review:** {next_review}")
                         
                         if st.button("Delete This", key=f"delete_single_{card_id}"):
                             delete_flashcard(card_id)
                             st.success(f"Flashcard #{display_order} deleted!")
                             st.rerun()
+            
+            mark_as_read(newly_read)
 
     # --- Quiz ---
     elif page == "🧠 Quiz":
@@ -521,6 +547,10 @@ def main():
                     st.session_state.answered = {}
                     st.session_state.user_choices = {}
                     st.session_state.quiz_options = {}
+                    # Shared distractor pool, built once per quiz
+                    st.session_state.answer_pool = list({
+                        c[2] for c in st.session_state.quiz_cards if c[2].strip()
+                    })
                     st.rerun()
         else:
             # Quiz in progress
@@ -533,9 +563,7 @@ def main():
 
                 # Generate options for this question
                 if st.session_state.quiz_index not in st.session_state.quiz_options:
-                    all_answers = [row[2] for row in st.session_state.quiz_cards if row[0] != card_id and row[2].strip() != ""]
-                    unique_answers = list(set(all_answers))
-                    distractor_pool = [ans for ans in unique_answers if ans != answer]
+                    distractor_pool = [ans for ans in st.session_state.answer_pool if ans != answer]
                     sample_count = min(3, len(distractor_pool))
                     distractors = random.sample(distractor_pool, sample_count) if sample_count > 0 else []
                     options = distractors + [answer]
@@ -563,14 +591,18 @@ def main():
                         st.rerun()
                 with col2:
                     if st.button("Next →"):
+                        # Update the score for this question only; answered[i] remembers
+                        # whether it was already counted so revisits don't double-count
+                        is_correct = user_choice == answer
+                        was_correct = st.session_state.answered.get(st.session_state.quiz_index, False)
+                        if is_correct != was_correct:
+                            st.session_state.score += 1 if is_correct else -1
+                        st.session_state.answered[st.session_state.quiz_index] = is_correct
+                        
                         if st.session_state.quiz_index < len(st.session_state.quiz_cards) - 1:
                             st.session_state.quiz_index += 1
                             st.rerun()
                         else:
-                            # Calculate score at the end
-                            for i, card in enumerate(st.session_state.quiz_cards):
-                                if st.session_state.user_choices.get(i) == card[2]:
-                                    st.session_state.score += 1
                             st.session_state.quiz_index += 1
                             st.rerun()
 
@@ -638,28 +670,8 @@ def main():
     elif page == "📊 Performance":
         st.header("📊 Performance Dashboard")
         
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-
-        # Get stats
-        c.execute("SELECT COUNT(*) FROM flashcards")
-        total = c.fetchone()[0]
-        
-        # Safe query for is_read column
-        try:
-            c.execute("SELECT COUNT(*) FROM flashcards WHERE is_read = FALSE")
-            unread = c.fetchone()[0]
-        except:
-            unread = total  # If column doesn't exist yet, assume all are unread
-        
-        c.execute("SELECT difficulty, COUNT(*) FROM flashcards GROUP BY difficulty ORDER BY difficulty")
-        difficulty_stats = c.fetchall()
-        
-        today_iso = date.today().isoformat()
-        c.execute("SELECT COUNT(*) FROM flashcards WHERE next_review <= ? OR next_review IS NULL", (today_iso,))
-        due_count = c.fetchone()[0]
-        
-        conn.close()
+        # Get stats (shared with the sidebar, so normally a cache hit)
+        total, unread, due_count, difficulty_stats = get_stats(date.today().isoformat())
 
         if total == 0:
             st.info("No flashcards yet. Upload some notes to get started!")
@@ -680,7 +692,7 @@ def main():
 
             # Difficulty chart
             st.subheader("🎯 Difficulty Distribution")
-            for d, cnt in difficulty_stats:
+            for d, cnt in sorted(difficulty_stats.items()):
                 percentage = (cnt / total) * 100
                 st.write(f"**Level {d}:** {cnt} cards")
                 st.progress(percentage / 100, text=f"{percentage:.1f}%")
@@ -694,6 +706,22 @@ def main():
             elif due_count > 0:
                 st.warning(f"⏰ You have {due_count} cards due for review. Time to study!")
 
+    # Sidebar statistics
+    with stats_container:
+        total_cards, unread_cards, due_cards, difficulty_stats = get_stats(date.today().isoformat())
+        
+        st.metric("Total Flashcards", total_cards)
+        st.metric("Unread Cards", unread_cards)
+        st.metric("Due Today", due_cards)
+        
+        if total_cards > 0:
+            st.markdown("**Difficulty Distribution:**")
+            for diff in range(1, 6):
+                count = difficulty_stats.get(diff, 0)
+                if count > 0:
+                    percentage = (count / total_cards) * 100
+                    st.write(f"Level {diff}: {count} ({percentage:.1f}%)")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file